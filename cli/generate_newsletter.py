@@ -1,5 +1,5 @@
 import argparse, pathlib, json
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from render import render_week
 from transform.league_narratives import build_narratives
 
 def main():
@@ -15,21 +15,11 @@ def main():
 
     nar = build_narratives(wk, season=season, state_dir=args.state_dir)
 
-    env = Environment(
-        loader=FileSystemLoader("render/templates"),
-        autoescape=select_autoescape(["html", "xml"]),
-        trim_blocks=True, lstrip_blocks=True,
-    )
-    ctx = {
-        "week": {"week": wk["week"], "timezone": wk["timezone"], "drop_time_et": wk["drop_time_et"]},
-        "scores": wk["scores"],
-        "teams_by_id": {t["team_id"]: t["name"] for t in wk["teams"]},
-        "nar": nar,
-    }
+    html, txt = render_week(wk, nar)
 
     out = pathlib.Path(args.out); out.mkdir(parents=True, exist_ok=True)
-    (out/"newsletter.html").write_text(env.get_template("newsletter.html.j2").render(**ctx), encoding="utf-8")
-    (out/"newsletter.txt").write_text(env.get_template("newsletter.txt.j2").render(**ctx), encoding="utf-8")
+    (out/"newsletter.html").write_text(html, encoding="utf-8")
+    (out/"newsletter.txt").write_text(txt, encoding="utf-8")
 
 if __name__ == "__main__":
     main()
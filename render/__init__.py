@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+TEMPLATE_DIR = "render/templates"
+
+
+@lru_cache(maxsize=None)
+def _env(template_dir: str = TEMPLATE_DIR) -> Environment:
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def render_week(wk: Dict[str, Any], nar: Dict[str, Any]) -> Tuple[str, str]:
+    """Render a WeekBundle + narrative into (html, txt) newsletter text."""
+    ctx = {
+        "week": {"week": wk["week"], "timezone": wk["timezone"], "drop_time_et": wk["drop_time_et"]},
+        "scores": wk["scores"],
+        "teams_by_id": {t["team_id"]: t["name"] for t in wk["teams"]},
+        "nar": nar,
+    }
+    env = _env()
+    html = env.get_template("newsletter.html.j2").render(**ctx)
+    txt = env.get_template("newsletter.txt.j2").render(**ctx)
+    return html, txt
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-import json
+from typing import TYPE_CHECKING, Any, Dict, List
 import os
 
-from .mfl_client import MFLClient
+if TYPE_CHECKING:  # annotations only; keeps requests out of the import path
+    from .mfl_client import MFLClient
 
+from .util import StandingsRow, env_flag, norm_fid, write_json
 
+
+@lru_cache(maxsize=4096)
 def _first_last(name: str) -> str:
     name = (name or "").strip()
     if "," in name:
-        last, first = [t.strip() for t in name.split(",", 1)]
-        return f"{first} {last}".strip()
+        last, _, first = name.partition(",")
+        return f"{first.strip()} {last.strip()}".strip()
     return name
 
 
@@ -60,25 +64,27 @@ def fetch_week_data(client: MFLClient, week: int) -> Dict[str, Any]:
     survivor_pool = client.get_survivor()
     players_dir = _players_directory(client)
 
-    # Dump raw weeklyResults for debugging so we can tailor the extractor
-    try:
-        out_dir = Path(os.environ.get("NPFFL_OUTDIR", "build"))
-        out_dir.mkdir(parents=True, exist_ok=True)
-        dump_path = out_dir / f"wr_week_{int(week):02d}.json"
-        dump_path.write_text(json.dumps(weekly_results, indent=2), encoding="utf-8")
-        print(f"[fetch_week] dumped raw weeklyResults -> {dump_path}")
-    except Exception as e:
-        print(f"[fetch_week] failed to dump weeklyResults: {e}")
+    # Dump raw weeklyResults for debugging so we can tailor the extractor (NPFFL_DEBUG=1)
+    if env_flag("NPFFL_DEBUG"):
+        try:
+            out_dir = Path(os.environ.get("NPFFL_OUTDIR", "build"))
+            out_dir.mkdir(parents=True, exist_ok=True)
+            dump_path = out_dir / f"wr_week_{int(week):02d}.json"
+            write_json(dump_path, weekly_results)
+            if env_flag("NPFFL_VERBOSE"):
+                print(f"[fetch_week] dumped raw weeklyResults -> {dump_path}")
+        except Exception as e:
+            print(f"[fetch_week] failed to dump weeklyResults: {e}")
 
     fmap: Dict[str, str] = {}
-    standings_rows: List[Dict[str, Any]] = []
+    standings_rows: List[StandingsRow] = []
     ls = (standings_json or {}).get("leagueStandings")
     if isinstance(ls, dict):
         fr_list = ls.get("franchise") or []
         if isinstance(fr_list, dict):
             fr_list = [fr_list]
         for fr in fr_list:
-            fid = str(fr.get("id") or "").strip()
+            fid = norm_fid(fr.get("id"))
             nm = (fr.get("name") or fr.get("fname") or fid).strip()
             fmap[fid] = nm
             try:
@@ -89,9 +95,10 @@ def fetch_week_data(client: MFLClient, week: int) -> Dict[str, Any]:
                 vp = float(fr.get("vp") or 0.0)
             except Exception:
                 vp = 0.0
-            standings_rows.append({"id": fid, "name": nm, "pf": pf, "vp": vp})
+            standings_rows.append(StandingsRow(id=fid, name=nm, pf=pf, vp=vp))
 
-    print(f"[fetch_week] players_dir size: {len(players_dir)}")
+    if env_flag("NPFFL_VERBOSE"):
+        print(f"[fetch_week] players_dir size: {len(players_dir)}")
 
     return {
         "weekly_results": weekly_results,
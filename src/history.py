@@ -4,10 +4,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 import statistics
 
+from .util import first_of, norm_fid
+
 History = Dict[str, Any]
 
-def _z4(x: str | int) -> str:
-    return str(x).zfill(4)
+_FID_KEYS = ("id", "franchise_id", "franchiseId", "franchiseID", "team_id", "teamId", "fid")
+_SAL_KEYS = ("total_sal", "salary", "total_salary")
 
 def load_history(dirpath: str | Path) -> History:
     p = Path(dirpath) / "history.json"
@@ -47,27 +49,18 @@ def update_history(
     eff_idx: Dict[str, Dict[str, Any]] = {}
     league_pts = league_sal = 0.0
     for row in team_efficiency:
-        fid_raw = (
-            row.get("id")
-            or row.get("franchise_id")
-            or row.get("franchiseId")
-            or row.get("franchiseID")
-            or row.get("team_id")
-            or row.get("teamId")
-            or row.get("fid")
-        )
-        fid4 = _z4(fid_raw or "")
+        fid4 = norm_fid(first_of(row, _FID_KEYS, ""))
         eff_idx[fid4] = row
         league_pts += float(row.get("total_pts") or 0.0)
-        league_sal += float(row.get("total_sal") or row.get("salary") or row.get("total_salary") or 0.0)
+        league_sal += float(first_of(row, _SAL_KEYS, 0.0))
 
     league_cpp = (league_sal / league_pts) if league_pts else 0.0
 
     for fid, pts in weekly_scores:
-        fid4 = _z4(fid)
+        fid4 = norm_fid(fid)
         name = franchise_names.get(fid4, f"Team {fid4}")
         eff = eff_idx.get(fid4, {})
-        sal = float(eff.get("total_sal") or eff.get("salary") or eff.get("total_salary") or 0.0)
+        sal = float(first_of(eff, _SAL_KEYS, 0.0))
         pts_val = float(pts)
         cpp = (sal / pts_val) if pts_val > 0 else 0.0
         ppk = (pts_val / (sal / 1000.0)) if sal > 0 else 0.0
@@ -4,13 +4,17 @@ from __future__ import annotations
 import glob
 import re
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
 import logging
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# normalized frames keyed on (path, mtime_ns, size) of the source sheet: backfill
+# resolves most weeks to the same sheet
+_FRAME_MEMO: Dict[Tuple[str, int, int], pd.DataFrame] = {}
+
 
 def _normalize_name(raw: str) -> str:
     """
@@ -29,9 +33,10 @@ def _normalize_name(raw: str) -> str:
 
     # Handle "Last, First" -> "First Last"
     if "," in name:
-        parts = [p.strip() for p in name.split(",", 1)]
-        if len(parts) == 2 and parts[0] and parts[1]:
-            name = f"{parts[1]} {parts[0]}"
+        last, _, first = name.partition(",")
+        last, first = last.strip(), first.strip()
+        if last and first:
+            name = f"{first} {last}"
 
     # Collapse spaces
     name = " ".join(name.split())
@@ -142,6 +147,11 @@ def _pick_week_file(pattern: str, week: int) -> Optional[Path]:
     return matches[-1]
 
 
+def _cache_key(xlsx_path: Path) -> Tuple[str, int, int]:
+    st = xlsx_path.stat()
+    return (str(xlsx_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
 def load_salary_file(
     salary_glob: str = "data/salaries/2025_*_Salary.xlsx",
     week: Optional[int] = None,
@@ -180,6 +190,11 @@ def load_salary_file(
                 week,
             )
 
+    key = _cache_key(xlsx_path)
+    hit = _FRAME_MEMO.get(key)
+    if hit is not None:
+        return hit.copy()  # callers may mutate; keep the memoized frame pristine
+
     raw = _read_excel_with_fallback(xlsx_path)
     if raw is None or raw.empty:
         raise ValueError(f"[load_salary] '{xlsx_path.name}' appears empty or unreadable.")
@@ -216,4 +231,5 @@ def load_salary_file(
     logger.info("[load_salary] Loaded %d salary rows from '%s'", len(df), xlsx_path.name)
     logger.info("[load_salary] Detected -> name='name', pos='pos', team='team', salary='salary'")
 
-    return df
+    _FRAME_MEMO[key] = df
+    return df.copy()
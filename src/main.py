@@ -3,7 +3,8 @@ This is an updated version of `src/main.py` for the NPFFL newsletter.  It
 integrates the Barstool-style narrative generator and Jinja2 templates
 directly into the newsletter pipeline.  The major changes are:
 
-1. Import `build_narratives` and Jinja2 at the top.
+1. Import `build_narratives` and the Jinja2 renderer (deferred until
+   `generate_newsletter` runs, so `--help` stays fast).
 2. In `generate_newsletter`, after assembling the legacy `payload`, build
    a WeekBundle from weekly scores and standings.
 3. Use `build_narratives` to create the narrative (`nar`) and render
@@ -16,49 +17,100 @@ produce the updated Barstool-style newsletter.
 
 from __future__ import annotations
 
-# New imports for Barstool narrative & templating
-from transform.league_narratives import build_narratives  # type: ignore
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-import argparse, glob, json, os, sys
+import argparse, glob, heapq, os, re, sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 
-import yaml
-from .mfl_client import MFLClient
 from .fetch_week import fetch_week_data
-from .load_salary import load_salary_file
-from .value_engine import compute_values
-from .newsletter import render_newsletter  # retained for compatibility but unused here
-from .odds_client import fetch_week_moneylines, build_team_prob_index, TEAM_MAP
 from .history import load_history, save_history, update_history, build_season_rankings
+from .util import StandingsRow, env_flag, first_of, norm_fid, write_json
+
+# ---------- rows ----------
+@dataclass(slots=True)
+class Starter:
+    player_id: str
+    player: str
+    pos: str
+    team: str | None
+    pts: float
 
 # ---------- utils ----------
+_EMPTY_DICT: Dict[str, Any] = {}
+# in-process memo of parsed configs: (resolved path, mtime_ns, size) -> cfg (callers treat it as read-only)
+_CFG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Tuple[Any, Any]:
+    # deferred — only needed when config.yaml has to be parsed (no memo hit)
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader
+        print("[config] libyaml not available; using the pure-Python YAML loader "
+              "(install libyaml-dev and reinstall PyYAML for faster parsing)", file=sys.stderr)
+    return yaml.load, loader
+
 def _read_config(path: str | Path = "config.yaml") -> Dict[str, Any]:
     p = Path(path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         return {}
-    with p.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    memo_key = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    hit = _CFG_CACHE.get(memo_key)
+    if hit is not None:
+        return hit
+    # hand libyaml the raw bytes; it decodes UTF-8 itself
+    yaml_load, loader = _yaml_loader()
+    cfg = yaml_load(p.read_bytes(), Loader=loader) or {}
+    _CFG_CACHE[memo_key] = cfg
+    return cfg
+
+_WEEK_LABELS = tuple(f"{i:02d}" for i in range(25))
 
 def _week_label(week: int | None) -> str:
-    return f"{int(week):02d}" if week is not None else "01"
+    if week is None:
+        return "01"
+    w = int(week)
+    return _WEEK_LABELS[w] if 0 <= w < 25 else f"{w:02d}"
 
 def _safe_float(x: Any, default: float = 0.0) -> float:
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
     try:
         return float(x)
     except Exception:
         return default
 
-def _merge_franchise_names(*maps: Dict[str, str] | None) -> Dict[str, str]:
+class _TeamNames(dict):
+    """fid -> display name; unknown ids read as "Team <fid>" without being stored."""
+    __slots__ = ()
+
+    def __missing__(self, fid: str) -> str:
+        return f"Team {fid}"
+
+def _merge_franchise_names(*maps: Mapping[str, str] | None) -> Dict[str, str]:
     out: Dict[str, str] = {}
     for mp in maps or []:
         if not mp:
             continue
-        for k, v in mp.items():
-            if k is None:
-                continue
-            out[str(k).zfill(4)] = str(v)
+        # read-only views of earlier merges are canonical by construction
+        if type(mp) is MappingProxyType:
+            out.update(mp)
+            continue
+        out.update(
+            (norm_fid(k), v if type(v) is str else str(v)) for k, v in mp.items() if k is not None
+        )
     return out
 
 def _history_weeks(history: Dict[str, Any]) -> set[int]:
@@ -73,19 +125,32 @@ def _history_weeks(history: Dict[str, Any]) -> set[int]:
                     continue
     return weeks
 
+@lru_cache(maxsize=None)
+def _split_dotted(dotted: str) -> Tuple[str, ...]:
+    return tuple(dotted.split("."))
+
 def _cfg_get(cfg: Dict[str, Any], dotted: str, default: Any = None) -> Any:
+    if "." not in dotted:  # top-level key: no path walk
+        return cfg.get(dotted, default) if isinstance(cfg, dict) else default
     cur = cfg
-    for part in dotted.split("."):
+    for part in _split_dotted(dotted):
         if not isinstance(cur, dict) or part not in cur:
             return default
         cur = cur[part]
     return cur
 
+def _cfg_first(cfg: Dict[str, Any], *paths: str, default: Any = None) -> Any:
+    for dotted in paths:
+        v = _cfg_get(cfg, dotted)
+        if v:
+            return v
+    return default
+
 def _int_or_none(s: str | None) -> int | None:
-    if s is None:
+    if not s:
         return None
-    s = str(s).strip()
-    return None if s == "" else int(s)
+    s = s.strip() if type(s) is str else str(s).strip()
+    return int(s) if s else None
 
 def _resolve_required_salaries_glob(cfg: Dict[str, Any]) -> str:
     cand: List[str] = []
@@ -103,7 +168,7 @@ def _resolve_required_salaries_glob(cfg: Dict[str, Any]) -> str:
         if not pat:
             continue
         tried.append(pat)
-        if glob.glob(pat):
+        if next(glob.iglob(pat), None) is not None:
             return pat
     print("[salary] No salary files found. Looked for:")
     for t in tried:
@@ -112,123 +177,172 @@ def _resolve_required_salaries_glob(cfg: Dict[str, Any]) -> str:
     sys.exit(2)
 
 # ---------- derivations ----------
-def _derive_weekly_scores(week_data: Dict[str, Any]) -> List[Tuple[str, float]]:
-    out: List[Tuple[str, float]] = []
+def _as_list(x: Any) -> List[Any]:
+    """MFL collapses one-element arrays to a bare object; normalize to a list."""
+    if type(x) is list:
+        return x
+    if type(x) is dict and x:
+        return [x]
+    return []
+
+def _weekly_franchises(week_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     wr = week_data.get("weekly_results") or {}
-    node = wr.get("weeklyResults") if isinstance(wr, dict) else {}
-    franchises = (node or {}).get("franchise") or []
-    if isinstance(franchises, dict):
-        franchises = [franchises]
-    for fr in (franchises or []):
-        fid = str(fr.get("id") or "").zfill(4)
-        out.append((fid, _safe_float(fr.get("score"), 0.0)))
-    return out
+    node = wr.get("weeklyResults") if type(wr) is dict else None
+    return _as_list((node or {}).get("franchise"))
+
+def _roster_players(fr: Dict[str, Any]) -> List[Dict[str, Any]]:
+    f_pl = fr.get("players") or fr.get("player")
+    if not f_pl:
+        return []
+    if type(f_pl) is dict:
+        f_pl = f_pl.get("player") or f_pl
+    return _as_list(f_pl)
+
+_STARTERS_RE = re.compile(r"[^,\s]+")
+_PTS_KEYS = ("score", "points")
+_POS_KEYS = ("position", "pos")
+
+def _first_num(d: Dict[str, Any], keys: Tuple[str, ...], default: float = 0.0) -> float:
+    for k in keys:
+        v = d.get(k)
+        if v:
+            t = type(v)
+            return float(v) if t is float or t is int else _safe_float(v, default)
+    return default
+
+def _player_meta(p: Dict[str, Any]) -> Dict[str, Any]:
+    team = p.get("team")
+    return {
+        "pts": _first_num(p, _PTS_KEYS),
+        "name": str(p.get("name") or "").strip(),
+        "pos": str(first_of(p, _POS_KEYS, "")).strip(),
+        "team": (str(team).strip() or None) if team else None,
+    }
 
-def _build_standings_rows(week_data: Dict[str, Any], f_map: Dict[str, str]) -> List[Dict[str, Any]]:
+def _derive_weekly_scores(week_data: Dict[str, Any]) -> List[Tuple[str, float]]:
+    fid_of, sf = norm_fid, _safe_float
+    return [(fid_of(fr.get("id")), sf(fr.get("score"), 0.0)) for fr in _weekly_franchises(week_data)]
+
+def _build_standings_rows(
+    week_data: Dict[str, Any],
+    f_map: Dict[str, str],
+    weekly_scores: List[Tuple[str, float]] | None = None,
+) -> List[StandingsRow]:
     rows = week_data.get("standings_rows")
-    if isinstance(rows, list) and rows:
+    if type(rows) is list and rows:
         return rows
     # fallback from weekly scores
-    out = []
-    for fid, pts in _derive_weekly_scores(week_data):
-        out.append({"id": fid, "name": f_map.get(fid, f"Team {fid}"), "pf": pts, "vp": 0.0})
-    out.sort(key=lambda r: (-_safe_float(r["vp"]), -_safe_float(r["pf"]), r["name"]))
+    if weekly_scores is None:
+        weekly_scores = _derive_weekly_scores(week_data)
+    out = [StandingsRow(id=fid, name=f_map.get(fid, f"Team {fid}"), pf=pts, vp=0.0) for fid, pts in weekly_scores]
+    out.sort(key=lambda r: (-r.vp, -r.pf, r.name))
     return out
 
-def _extract_starters_by_franchise(week_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-    out: Dict[str, List[Dict[str, Any]]] = {}
-    wr = week_data.get("weekly_results") or {}
-    wrn = wr.get("weeklyResults") if isinstance(wr, dict) else {}
+def _enrich(pid: str, meta: Dict[str, Any], pm: Dict[str, Any]) -> Starter:
+    return Starter(
+        player_id=pid,
+        player=(meta.get("name") or pm.get("first_last") or pm.get("raw") or "").strip(),
+        pos=(meta.get("pos") or pm.get("pos") or "").strip(),
+        team=(meta.get("team") or pm.get("team") or None),
+        pts=_safe_float(meta.get("pts"), 0.0),
+    )
+
+def _walk_weekly_results(
+    week_data: Dict[str, Any],
+) -> Tuple[List[Tuple[str, float]], Dict[str, List[Starter]]]:
+    """One pass over weeklyResults -> ([(fid, score)], {fid: [Starter]})."""
+    scores: List[Tuple[str, float]] = []
+    starters_by_fid: Dict[str, List[Starter]] = {}
     players_map: Dict[str, Dict[str, Any]] = week_data.get("players_map") or {}
-    franchises = (wrn or {}).get("franchise") or []
-    if isinstance(franchises, dict):
-        franchises = [franchises]
-    for fr in franchises or []:
-        fid = str(fr.get("id") or "").zfill(4)
-        # per-team player index
-        f_pl = fr.get("players") or fr.get("player") or []
-        if isinstance(f_pl, dict):
-            f_pl = f_pl.get("player") or f_pl
-        if isinstance(f_pl, dict):
-            f_pl = [f_pl]
-        fp_idx: Dict[str, Dict[str, Any]] = {}
-        for p in (f_pl or []):
-            pid = str(p.get("id") or "").strip()
-            fp_idx[pid] = {
-                "pts": _safe_float(p.get("score") or p.get("points") or 0.0),
-                "name": str(p.get("name") or "").strip(),
-                "pos": str(p.get("position") or p.get("pos") or "").strip(),
-                "team": (str(p.get("team") or "").strip() or None),
-            }
+    pm_get = players_map.get
+    # hot loop: bind helpers and bound methods once
+    fid_of, sf, enrich, meta_of = norm_fid, _safe_float, _enrich, _player_meta
+    findall = _STARTERS_RE.findall
+    add_score = scores.append
+    sbf_get = starters_by_fid.get
+    for fr in _weekly_franchises(week_data):
+        fid = fid_of(fr.get("id"))
+        score = sf(fr.get("score"), 0.0)
+        add_score((fid, score))
         starters = fr.get("starters")
-        rows: List[Dict[str, Any]] = []
-        if isinstance(starters, str) and starters.strip():
-            for pid in [t.strip() for t in starters.split(",") if t.strip()]:
-                meta = fp_idx.get(pid) or {}
-                pm = players_map.get(pid, {})
-                rows.append({
-                    "player_id": pid,
-                    "player": (meta.get("name") or pm.get("first_last") or pm.get("raw") or "").strip(),
-                    "pos": (meta.get("pos") or pm.get("pos") or "").strip(),
-                    "team": (meta.get("team") or pm.get("team") or None),
-                    "pts": _safe_float(meta.get("pts"), 0.0),
-                })
+        starter_ids = findall(starters) if type(starters) is str else []
+        rows: List[Starter] = []
+        if starter_ids:
+            # per-team index of the starters only; bench nodes are never looked up
+            wanted = set(starter_ids)
+            fp_idx: Dict[str, Dict[str, Any]] = {}
+            for p in _roster_players(fr):
+                pid = str(p.get("id") or "").strip()
+                if pid in wanted:
+                    fp_idx[pid] = meta_of(p)
+            fp_get = fp_idx.get
+            rows = [enrich(pid, fp_get(pid) or _EMPTY_DICT, pm_get(pid, _EMPTY_DICT)) for pid in starter_ids]
         if not rows:
-            score = _safe_float(fr.get("score") or 0.0)
-            rows.append({"player_id": "", "player": "Team Total", "pos": "", "team": None, "pts": score})
-        out.setdefault(fid, []).extend(rows)
-    return out
+            rows.append(Starter(player_id="", player="Team Total", pos="", team=None, pts=score))
+        prev = sbf_get(fid)
+        starters_by_fid[fid] = prev + rows if prev else rows
+    return scores, starters_by_fid
+
+def _starters_payload(starters_by_fid: Dict[str, List[Starter]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Plain-dict starters for the legacy payload consumers (roastbook / post_outputs)."""
+    return {fid: [asdict(s) for s in rows] for fid, rows in starters_by_fid.items()}
 
-def _derive_vp_drama(standings: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _derive_vp_drama(standings: List[StandingsRow]) -> Dict[str, Any]:
     if not standings:
         return {}
-    rows = sorted(standings, key=lambda r: (-_safe_float(r.get("vp")), -_safe_float(r.get("pf"))))
-    mids = [r for r in rows if _safe_float(r.get("vp")) == 2.5]
-    lows = [r for r in rows if _safe_float(r.get("vp")) == 0.0]
-    if not mids or not lows:
+    # one pass: lowest-pf 2.5-VP team (last on ties) and highest-pf 0-VP team (first on ties)
+    last_in = first_out = None
+    for r in standings:
+        if r.vp == 2.5:
+            if last_in is None or r.pf <= last_in.pf:
+                last_in = r
+        elif r.vp == 0.0:
+            if first_out is None or r.pf > first_out.pf:
+                first_out = r
+    if last_in is None or first_out is None:
         return {}
-    last_in = mids[-1]
-    first_out = lows[0]
-    gap = round(_safe_float(last_in["pf"]) - _safe_float(first_out["pf"]), 2)
+    gap = round(last_in.pf - first_out.pf, 2)
+    top = heapq.nsmallest(6, standings, key=lambda r: (-r.vp, -r.pf))
     return {
-        "villain": last_in["name"],
-        "bubble": first_out["name"],
+        "villain": last_in.name,
+        "bubble": first_out.name,
         "gap_pf": gap,
-        "top5": rows[:5],
-        "sixth": rows[5] if len(rows) > 5 else None,
+        # plain dicts: the roastbook/post_outputs blurbs index these rows
+        "top5": [asdict(r) for r in top[:5]],
+        "sixth": asdict(top[5]) if len(top) > 5 else None,
     }
 
 def _derive_headliners(
-    starters_by_franchise: Dict[str, List[Dict[str, Any]]],
+    starters_by_franchise: Dict[str, List[Starter]],
     players_map: Dict[str, Dict[str, Any]],
     f_map: Dict[str, str],
     top_n: int = 10,
 ) -> List[Dict[str, Any]]:
     use: Dict[str, Dict[str, Any]] = {}
+    use_get = use.get
+    pm_get = players_map.get
+    sf = _safe_float
     for fid, rows in (starters_by_franchise or {}).items():
         who = f_map.get(fid, f"Team {fid}")
         for r in rows:
-            pid = str(r.get("player_id") or "").strip()
+            pid = (r.player_id or "").strip()
             if not pid:
                 continue
-            pts = _safe_float(r.get("pts"), 0.0)
-            pm = players_map.get(pid, {})
-            name = (r.get("player") or pm.get("first_last") or pm.get("raw") or pid).strip()
-            pos = (r.get("pos") or pm.get("pos") or "").strip()
-            team = (r.get("team") or pm.get("team") or "").strip()
-            bucket = use.setdefault(
-                pid,
-                {
-                    "player": name,
-                    "pos": pos,
-                    "team": team,
+            pts = sf(r.pts, 0.0)
+            bucket = use_get(pid)
+            if bucket is None:
+                pm = pm_get(pid) or _EMPTY_DICT
+                bucket = use[pid] = {
+                    "player": (r.player or pm.get("first_last") or pm.get("raw") or pid).strip(),
+                    "pos": (r.pos or pm.get("pos") or "").strip(),
+                    "team": (r.team or pm.get("team") or "").strip(),
                     "pts": pts,
                     "managers": set(),
-                },
-            )
-            bucket["pts"] = max(bucket["pts"], pts)
+                }
+            elif pts > bucket["pts"]:
+                bucket["pts"] = pts
             bucket["managers"].add(who)
-    rows = [
+    return [
         {
             "player": v["player"],
             "pos": v["pos"],
@@ -236,54 +350,62 @@ def _derive_headliners(
             "pts": v["pts"],
             "managers": sorted(v["managers"]),
         }
-        for v in use.values()
+        for v in heapq.nlargest(top_n, use.values(), key=itemgetter("pts"))
     ]
-    rows.sort(key=lambda x: -x["pts"])
-    return rows[:top_n]
+
+def _franchise_week_blocks(node: Dict[str, Any], week: int) -> Iterator[Tuple[str, Dict[str, Any] | None]]:
+    """Yield (fid, block for ``week`` or None) for each franchise of a pool node."""
+    week_str = str(week)
+    for fr in _as_list(node.get("franchise")):
+        wk_blocks = _as_list(fr.get("week"))
+        target = next((w for w in wk_blocks if str(w.get("week") or "") == week_str), None)
+        yield norm_fid(fr.get("id")), target
 
 # ---------- odds summaries ----------
+@lru_cache(maxsize=64)
 def _mfl_code_to_odds(team_code: str) -> str:
-    return TEAM_MAP.get(team_code.upper().strip(), team_code.upper().strip())
+    from .odds_client import TEAM_MAP  # deferred; memoized per code
+
+    code = team_code.strip().upper()
+    return TEAM_MAP.get(code, code)
 
 def _confidence_summary(conf3: List[Dict[str, Any]], team_prob: Dict[str, float]) -> Dict[str, Any]:
     all_picks: List[str] = []
     scored: List[Tuple[str, float]] = []
+    to_odds, tp_get = _mfl_code_to_odds, team_prob.get
+    add_pick, add_scored = all_picks.append, scored.append
     for row in conf3:
         for g in row.get("top3", []):
-            t = _mfl_code_to_odds(str(g.get("pick", "")))
+            t = to_odds(str(g.get("pick", "")))
             if not t:
                 continue
-            all_picks.append(t)
-            prob = float(team_prob.get(t, 0.5))
-            scored.append((t, prob))
+            add_pick(t)
+            add_scored((t, float(tp_get(t, 0.5))))
     boring = None
     if all_picks:
-        from collections import Counter
-
-        c = Counter(all_picks)
-        boring = sorted(c.items(), key=lambda x: (-x[1], x[0]))[0][0]
+        boring = min(Counter(all_picks).items(), key=lambda x: (-x[1], x[0]))[0]
     boldest = None
     if scored:
-        scored.sort(key=lambda x: x[1])  # lowest prob first
-        boldest = scored[0][0]
+        boldest = min(scored, key=lambda x: x[1])[0]  # lowest prob
     return {"boring_pick": boring, "boldest_pick": boldest}
 
 def _survivor_summary(surv: List[Dict[str, Any]], team_prob: Dict[str, float]) -> Dict[str, Any]:
     if not surv:
         return {}
-    picks = [_mfl_code_to_odds(r.get("pick", "")) for r in surv if r.get("pick")]
+    to_odds, tp_get = _mfl_code_to_odds, team_prob.get
+    picks = [to_odds(p) for p in (r.get("pick") for r in surv) if p]
     if not picks:
         return {"boring_consensus": None, "boldest_lifeline": None}
-    from collections import Counter
-
-    c = Counter(picks)
-    boring = sorted(c.items(), key=lambda x: (-x[1], x[0]))[0][0]
-    boldest = sorted(picks, key=lambda t: team_prob.get(t, 0.5))[0]
+    boring = min(Counter(picks).items(), key=lambda x: (-x[1], x[0]))[0]
+    boldest = min(picks, key=lambda t: tp_get(t, 0.5))
     return {"boring_consensus": boring, "boldest_lifeline": boldest}
 
 # ---------- CLI ----------
 def _parse_args() -> argparse.Namespace:
-    ap = argparse.ArgumentParser(description="NPFFL Weekly Newsletter generator")
+    ap = argparse.ArgumentParser(
+        description="NPFFL Weekly Newsletter generator",
+        epilog="Set NPFFL_DEBUG=1 to also write wr_week_XX.json and context_week_XX.json to the out dir.",
+    )
     ap.add_argument("--config", default=os.environ.get("NPFFL_CONFIG", "config.yaml"))
     ap.add_argument("--week", type=_int_or_none, default=None)
     ap.add_argument("--out-dir", default=os.environ.get("NPFFL_OUTDIR", "build"))
@@ -297,47 +419,56 @@ def generate_newsletter(
     computes values and standings, updates the season history, and then renders
     the Barstool-style newsletter using the narrative engine and Jinja templates.
     """
-    league_id = str(cfg.get("league_id") or os.environ.get("MFL_LEAGUE_ID") or "").strip()
-    year = int(cfg.get("year") or os.environ.get("MFL_YEAR") or 2025)
-    tz = cfg.get("timezone") or cfg.get("tz") or "America/New_York"
+    # deferred — heavy imports (pandas, rapidfuzz, requests, urllib/ssl); keeps --help and helper imports fast
+    from .load_salary import load_salary_file
+    from .mfl_client import MFLClient
+    from .odds_client import build_team_prob_index, fetch_week_moneylines
+    from .value_engine import compute_values
+    from render import render_week  # jinja2 environment
+    from transform.league_narratives import build_narratives  # type: ignore
+
+    env_get = os.environ.get
+    league_id = str(cfg.get("league_id") or env_get("MFL_LEAGUE_ID") or "").strip()
+    year = int(cfg.get("year") or env_get("MFL_YEAR") or 2025)
+    tz = _cfg_first(cfg, "timezone", "tz", default="America/New_York")
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    history_dir_cfg = (
-        _cfg_get(cfg, "history.dir")
-        or _cfg_get(cfg, "history.path")
-        or _cfg_get(cfg, "history_dir")
-    )
+    history_dir_cfg = _cfg_first(cfg, "history.dir", "history.path", "history_dir")
     history_dir = Path(history_dir_cfg) if history_dir_cfg else Path("data") / "history"
     history_dir.mkdir(parents=True, exist_ok=True)
 
-    # instantiate MFL client (trying various arg names for timezone)
-    try:
-        client = MFLClient(league_id=league_id, year=year, tz=tz)
-    except TypeError:
-        try:
-            client = MFLClient(league_id=league_id, year=year, timezone=tz)
-        except TypeError:
-            client = MFLClient(league_id=league_id, year=year)
-            setattr(client, "tz", tz)
-            setattr(client, "timezone", tz)
-
-    week_data: Dict[str, Any] = fetch_week_data(client, week=week) or {}
-    f_names = _merge_franchise_names(
-        week_data.get("franchise_names"),
+    # instantiate MFL client (its constructor takes no timezone kwarg)
+    client = MFLClient(league_id=league_id, year=year)
+    setattr(client, "tz", tz)
+    setattr(client, "timezone", tz)
+
+    # Salaries (required) — resolved up front so a missing sheet fails fast
+    salary_glob = _resolve_required_salaries_glob(cfg)
+
+    # MFL fetch (network), salary sheet parse (disk) and the odds board (network)
+    # are independent; overlap them
+    api_key = env_get("THE_ODDS_API_KEY")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        week_fut = pool.submit(fetch_week_data, client, week=week)
+        salary_fut = pool.submit(load_salary_file, salary_glob, week=week)
+        odds_fut = pool.submit(fetch_week_moneylines, api_key)
+        week_data: Dict[str, Any] = week_fut.result() or {}
+        salaries_df = salary_fut.result()
+        odds_games = odds_fut.result()
+
+    # client/config names override the per-week feed; merge them once for every week built here
+    fixed_names = MappingProxyType(_merge_franchise_names(
         getattr(client, "franchise_names", None),
         cfg.get("franchise_names"),
-    )
+    ))
+    f_names = _TeamNames(_merge_franchise_names(week_data.get("franchise_names"), fixed_names))
 
-    # Weekly bits
-    standings_rows = _build_standings_rows(week_data, f_names)
-    starters_by_franchise = _extract_starters_by_franchise(week_data)
+    # Weekly bits (one walk over weeklyResults feeds scores, standings fallback and starters)
+    weekly_scores_pairs, starters_by_franchise = _walk_weekly_results(week_data)  # [(fid, pts)]
+    standings_rows = _build_standings_rows(week_data, f_names, weekly_scores_pairs)
     players_map = week_data.get("players_map") or week_data.get("players") or {}
 
-    # Salaries (required)
-    salary_glob = _resolve_required_salaries_glob(cfg)
-    salaries_df = load_salary_file(salary_glob, week=week)
-
     # Values/Efficiency
     values_out: Dict[str, Any] = compute_values(
         salaries_df, players_map, starters_by_franchise, f_names, week=week, year=year
@@ -347,13 +478,13 @@ def generate_newsletter(
     team_efficiency = values_out.get("team_efficiency", [])
 
     # Scores list for history + narrative
-    weekly_scores_pairs = _derive_weekly_scores(week_data)  # [(fid, pts)]
     scores_info = {
         "rows": sorted(
-            [(f_names.get(fid, f"Team {fid}"), pts) for fid, pts in weekly_scores_pairs],
-            key=lambda t: -t[1],
+            [(f_names[fid], pts) for fid, pts in weekly_scores_pairs],
+            key=itemgetter(1),
+            reverse=True,
         ),
-        "avg": round(sum(pts for _, pts in weekly_scores_pairs) / len(weekly_scores_pairs), 2)
+        "avg": round(sum(map(itemgetter(1), weekly_scores_pairs)) / len(weekly_scores_pairs), 2)
         if weekly_scores_pairs
         else None,
     }
@@ -371,63 +502,32 @@ def generate_newsletter(
     survivor_pool = week_data.get("survivor_pool") or {}
 
     conf3 = []
-    node = (pool_nfl.get("poolPicks") or {})
-    franchises = node.get("franchise") or []
-    if isinstance(franchises, dict):
-        franchises = [franchises]
-    for fr in franchises:
-        fid = str(fr.get("id") or "").zfill(4)
-        name = f_names.get(fid, f"Team {fid}")
-        wk_blocks = fr.get("week") or []
-        if isinstance(wk_blocks, dict):
-            wk_blocks = [wk_blocks]
-        target = None
-        for w in wk_blocks:
-            if str(w.get("week") or "") == str(week):
-                target = w
-                break
+    for fid, target in _franchise_week_blocks(pool_nfl.get("poolPicks") or {}, week):
         if not target:
             continue
-        games = target.get("game") or []
-        if isinstance(games, dict):
-            games = [games]
         picks = []
-        for g in games:
+        for g in _as_list(target.get("game")):
             try:
                 rank = int(str(g.get("rank") or "0"))
             except Exception:
                 rank = 0
             picks.append({"rank": rank, "pick": str(g.get("pick") or "").strip()})
         picks.sort(key=lambda r: -r["rank"])
-        conf3.append({"team": name, "top3": picks[:3]})
+        conf3.append({"team": f_names[fid], "top3": picks[:3]})
 
     # Survivor list
     survivor_list = []
-    node = (survivor_pool.get("survivorPool") or survivor_pool or {})
-    franchises = node.get("franchise") or []
-    if isinstance(franchises, dict):
-        franchises = [franchises]
     surv_no = []
-    for fr in franchises:
-        fid = str(fr.get("id") or "").zfill(4)
-        name = f_names.get(fid, f"Team {fid}")
-        wk_blocks = fr.get("week") or []
-        if isinstance(wk_blocks, dict):
-            wk_blocks = [wk_blocks]
-        pick = ""
-        for w in wk_blocks:
-            if str(w.get("week") or "") == str(week):
-                pick = str(w.get("pick") or "").strip()
-                break
+    for fid, target in _franchise_week_blocks(survivor_pool.get("survivorPool") or survivor_pool or {}, week):
+        name = f_names[fid]
+        pick = str(target.get("pick") or "").strip() if target else ""
         if pick:
             survivor_list.append({"team": name, "pick": pick})
         else:
             surv_no.append(name)
 
     # Odds → implied probabilities → summaries
-    api_key = os.environ.get("THE_ODDS_API_KEY")
-    games = fetch_week_moneylines(api_key)
-    team_prob = build_team_prob_index(games)
+    team_prob = build_team_prob_index(odds_games)
     conf_summary = _confidence_summary(conf3, team_prob)
     conf_no = [t["team"] for t in conf3 if not t.get("top3")]
     surv_summary = _survivor_summary(survivor_list, team_prob)
@@ -449,16 +549,11 @@ def generate_newsletter(
         except Exception as exc:
             print(f"[history] Failed to fetch week {wk}: {exc}")
             continue
-        wk_fnames = _merge_franchise_names(
-            wk_data.get("franchise_names"),
-            getattr(client, "franchise_names", None),
-            cfg.get("franchise_names"),
-        )
-        wk_scores = _derive_weekly_scores(wk_data)
+        wk_fnames = _merge_franchise_names(wk_data.get("franchise_names"), fixed_names)
+        wk_scores, wk_starters = _walk_weekly_results(wk_data)
         if not wk_scores:
             print(f"[history] No scores found for week {wk}; skipping")
             continue
-        wk_starters = _extract_starters_by_franchise(wk_data)
         wk_players = wk_data.get("players_map") or wk_data.get("players") or {}
         try:
             wk_salary_df = load_salary_file(salary_glob, week=wk)
@@ -516,14 +611,14 @@ def generate_newsletter(
         "year": year,
         "league_id": league_id,
         "franchise_names": f_names,
-        "standings_rows": standings_rows,
+        "standings_rows": [asdict(r) for r in standings_rows],
         "team_efficiency": team_efficiency,
         "top_values": top_values,
         "top_busts": top_busts,
         "scores_info": scores_info,
         "vp_drama": vp_drama,
         "headliners": headliners,
-        "starters_by_franchise": starters_by_franchise,
+        "starters_by_franchise": _starters_payload(starters_by_franchise),
         # pools
         "confidence_top3": conf3,
         "team_prob": team_prob,
@@ -538,18 +633,17 @@ def generate_newsletter(
         "assets": assets_payload,
     }
 
-    # Write context for debugging
-    try:
-        (out_dir / f"context_week_{_week_label(week)}.json").write_text(
-            json.dumps(payload, indent=2, default=str), encoding="utf-8"
-        )
-    except Exception:
-        pass
+    # Write context for debugging (NPFFL_DEBUG=1)
+    if env_flag("NPFFL_DEBUG"):
+        try:
+            write_json(out_dir / f"context_week_{_week_label(week)}.json", payload)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[context] Failed to write context JSON: {e}", file=sys.stderr)
 
     # --------------------------------------------------------------------------------
     # Build the WeekBundle for Barstool narrative
     # Create mapping from fid to manager name (f_names maps fid->manager)
-    fid_name_map = {fid: f_names.get(fid, f"Team {fid}") for fid, _ in weekly_scores_pairs}
+    fid_name_map = {fid: f_names[fid] for fid, _ in weekly_scores_pairs}
     teams_list = [{"team_id": fid, "name": name} for fid, name in fid_name_map.items()]
     scores_list = [
         {
@@ -563,9 +657,9 @@ def generate_newsletter(
     ]
     vp_table = [
         {
-            "team_id": str(row.get("id") or row.get("team_id")),
+            "team_id": str(row.id),
             "vp_cutoff_diff": 0.0,
-            "got_2p5": _safe_float(row.get("vp"), 0.0) >= 2.5,
+            "got_2p5": row.vp >= 2.5,
         }
         for row in standings_rows or []
     ]
@@ -584,25 +678,8 @@ def generate_newsletter(
     }
     season_year = int(cfg.get("year") or payload.get("year") or 2025)
     nar = build_narratives(week_bundle, season=season_year, state_dir="state")
-    ctx = {
-        "week": {
-            "week": week_bundle["week"],
-            "timezone": week_bundle["timezone"],
-            "drop_time_et": week_bundle["drop_time_et"],
-        },
-        "scores": week_bundle["scores"],
-        "teams_by_id": {t["team_id"]: t["name"] for t in week_bundle["teams"]},
-        "nar": nar,
-    }
-    env = Environment(
-        loader=FileSystemLoader("render/templates"),
-        autoescape=select_autoescape(["html", "xml"]),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    html_text, txt_text = render_week(week_bundle, nar)
     week_lbl = _week_label(week)
-    html_text = env.get_template("newsletter.html.j2").render(**ctx)
-    txt_text = env.get_template("newsletter.txt.j2").render(**ctx)
     html_path = out_dir / f"NPFFL_Week_{week_lbl}.html"
     md_path = out_dir / f"NPFFL_Week_{week_lbl}.md"
     html_path.write_text(html_text, encoding="utf-8")
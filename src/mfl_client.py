@@ -7,6 +7,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 
@@ -132,6 +133,10 @@ class MFLClient:
         url = f"{self.base}/export"
         r = self.sess.get(url, params=params, timeout=self.timeout)
         r.raise_for_status()
+        try:
+            return orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            pass
         try:
             return r.json()
         except Exception:
@@ -113,6 +113,7 @@ def _mk_md(payload: Dict[str, Any]) -> str:
 
     from . import roastbook as rb
     from .prose import ProseBuilder
+    from .util import norm_fid
 
     tone = rb.Tone(tone_name)
     pb_intro = ProseBuilder(tone)
@@ -377,7 +378,7 @@ def _mk_md(payload: Dict[str, Any]) -> str:
             headers = ["#", "Team", "Pts (YTD)", "Avg"]
             rows = []
             for r in season_rank:
-                fid = str(r["id"]).zfill(4)
+                fid = norm_fid(r["id"])
                 if use_logos:
                     logo_cell = _embed_logo_html(fid, r["team"], logos_dir, logo_width_px)
                 else:
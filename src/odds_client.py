@@ -53,7 +53,8 @@ def _american_to_prob(odds: float) -> float:
     return (-o) / ((-o) + 100.0)
 
 def _norm(team: str) -> str:
-    return TEAM_MAP.get(team.upper().strip(), team.upper().strip())
+    code = team.strip().upper()
+    return TEAM_MAP.get(code, code)
 
 def fetch_week_moneylines(api_key: Optional[str], retries: int = 3, backoff: float = 1.0) -> List[Dict[str, Any]]:
     """
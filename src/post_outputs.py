@@ -327,9 +327,8 @@ def survivor_story(surv: List[Dict[str, Any]], team_prob: Dict[str, float], no_p
             if len(picks) > 2:
                 bold.append(f"{picks[2][0]} → {picks[2][1]}")
             pieces.append(f"{tone.emojis['fire']} **Boldest Lifelines:** {', '.join(bold)} — tightrope work, clean landing.")
-            from collections import Counter
             codes = [c for _,c,_ in picks]
-            common_code, _ = sorted(Counter(codes).items(), key=lambda x: (-x[1], x[0]))[0]
+            common_code, _ = min(Counter(codes).items(), key=lambda x: (-x[1], x[0]))
             p = float(team_prob.get(common_code, 0.75))
             pieces.append(f"{tone.emojis['ice']} **Boring Consensus:** {common_code} ({int(round(p*100))}% implied) — training wheels engaged.")
     if no_picks:
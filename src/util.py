@@ -0,0 +1,61 @@
+# src/util.py
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import orjson
+
+
+@dataclass(slots=True)
+class StandingsRow:
+    id: str
+    name: str
+    pf: float
+    vp: float
+
+
+def first_of(d: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """First truthy ``d[k]`` over ``keys`` (alias-tolerant field lookup), else ``default``."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag(name: str) -> bool:
+    """Opt-in env switch (NPFFL_DEBUG, NPFFL_VERBOSE): only 1/true/yes/on enable it, so =0 stays off."""
+    return os.environ.get(name, "").strip().lower() in _TRUTHY
+
+
+@lru_cache(maxsize=256, typed=True)
+def norm_fid(raw: Any) -> str:
+    """Canonical 4-digit franchise id ("1", 1, " 0001 " -> "0001"; None -> "0000").
+
+    The single id padder: every module imports this so ids line up everywhere.
+    """
+    if type(raw) is int and raw >= 0:  # MFL JSON sometimes sends numeric ids
+        return f"{raw:04d}"
+    return str(raw or "").strip().zfill(4)
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+def write_json(path: Path, payload: Any) -> None:
+    """Indented JSON dump for the debug/context files (dataclasses and numpy scalars included)."""
+    path.write_bytes(orjson.dumps(
+        payload,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        default=_json_default,
+    ))
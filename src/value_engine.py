@@ -1,12 +1,17 @@
 # src/value_engine.py
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Optional
 
 import pandas as pd
 from rapidfuzz import process, fuzz
 
+from .util import norm_fid
+
 
 @dataclass
 class StarterRow:
@@ -23,28 +28,68 @@ class StarterRow:
 def _to_name_first_last(name: str) -> str:
     if not isinstance(name, str):
         return ""
+    return _flip_name(name)
+
+
+@lru_cache(maxsize=4096)
+def _flip_name(name: str) -> str:
     nm = name.strip()
     if "," in nm:
-        a, b = [p.strip() for p in nm.split(",", 1)]
+        a, _, b = nm.partition(",")
+        a, b = a.strip(), b.strip()
         if a and b:
             nm = f"{b} {a}"
     return " ".join(nm.split())
 
 
+def _starter_fields(it: Any) -> Tuple[str, Any, Any, Any, Any]:
+    """(player_id, name, pos, team, pts) from a starter dict or a ``Starter`` row."""
+    if isinstance(it, dict):
+        return (
+            str(it.get("player_id") or it.get("id") or ""),
+            it.get("player") or it.get("name") or "",
+            it.get("pos") or it.get("position") or "",
+            it.get("team") or it.get("nflteam") or "",
+            it.get("pts") or it.get("points") or 0.0,
+        )
+    return (str(it.player_id or ""), it.player or "", it.pos or "", it.team or "", it.pts or 0.0)
+
+
 def _norm_key(name: str, pos: str, team: str) -> Tuple[str, str, str]:
     return (name.strip().lower(), pos.strip().upper(), team.strip().upper())
 
 
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
 def _build_salary_index(salary_df: pd.DataFrame) -> Dict[Tuple[str, str, str], int]:
-    idx: Dict[Tuple[str, str, str], int] = {}
-    for _, r in salary_df.iterrows():
-        nm = _to_name_first_last(str(r.get("name", "")))
-        pos = str(r.get("pos", "")).upper()
-        team = str(r.get("team", "")).upper()
-        sal = int(r.get("salary", 0) or 0)
-        if nm:
-            idx[_norm_key(nm, pos, team)] = sal
-    return idx
+    # column-wise normalization; same keys as _norm_key(_to_name_first_last(name), pos, team)
+    names = _column(salary_df, "name", "").astype(str).map(_to_name_first_last)
+    pos = _column(salary_df, "pos", "").astype(str).str.upper().str.strip()
+    team = _column(salary_df, "team", "").astype(str).str.upper().str.strip()
+    sal = _column(salary_df, "salary", 0).fillna(0).astype(int)
+    keep = names != ""
+    keys = zip(names[keep].str.strip().str.lower(), pos[keep], team[keep])
+    return dict(zip(keys, sal[keep].tolist()))
+
+
+Candidates = Dict[Optional[str], Tuple[List[Tuple[str, str, str]], List[str]]]
+
+
+def _candidates_by_pos(table: Dict[Tuple[str, str, str], int]) -> Candidates:
+    """Parallel (keys, names) lists per POS, plus ``None`` holding every key."""
+    out: Candidates = {None: ([], [])}
+    all_keys, all_names = out[None]
+    for k in table:
+        keys, names = out.setdefault(k[1], ([], []))
+        keys.append(k)
+        names.append(k[0])
+        all_keys.append(k)
+        all_names.append(k[0])
+    return out
 
 
 def _fuzzy_lookup(
@@ -52,6 +97,7 @@ def _fuzzy_lookup(
     table: Dict[Tuple[str, str, str], int],
     cache: Dict[Tuple[str, str, str], int],
     score_cutoff: int = 88,
+    candidates: Optional[Candidates] = None,
 ) -> Optional[int]:
     """
     Try exact first; otherwise fuzzy match on the name part with same POS.
@@ -63,13 +109,14 @@ def _fuzzy_lookup(
         return table[name_key]
 
     name_lc, pos, team = name_key
+    if candidates is None:
+        candidates = _candidates_by_pos(table)
     # limit candidates to same POS; if that fails, allow any POS
-    same_pos = [k for k in table.keys() if k[1] == pos]
-    search_space = same_pos if same_pos else list(table.keys())
+    search_space, names = candidates.get(pos) or candidates[None]
 
     cand = process.extractOne(
         name_lc,
-        [k[0] for k in search_space],
+        names,
         scorer=fuzz.token_sort_ratio,
         score_cutoff=score_cutoff,
     )
@@ -84,7 +131,7 @@ def _fuzzy_lookup(
 def compute_values(
     salary_df: pd.DataFrame,
     players_map: Dict[str, Dict[str, Any]],
-    starters_by_franchise: Dict[str, List[Dict[str, Any]]],
+    starters_by_franchise: Dict[str, List[Any]],
     franchise_names: Dict[str, str],
     week: Optional[int] = None,
     year: Optional[int] = None,
@@ -101,34 +148,36 @@ def compute_values(
     # Build a fast salary index
     sal_idx = _build_salary_index(salary_df)
     fuzzy_cache: Dict[Tuple[str, str, str], int] = {}
+    candidates = _candidates_by_pos(sal_idx)
 
     starters_out: List[StarterRow] = []
 
     # Flatten starters and attach names/pos/team via players_map when needed
+    pm_get = players_map.get
     for fid, items in (starters_by_franchise or {}).items():
-        fid = str(fid).zfill(4)
+        fid = norm_fid(fid)
         for it in items:
-            pid = str(it.get("player_id") or it.get("id") or "")
-            nm = it.get("player") or it.get("name") or ""
-            if not nm and pid and pid in players_map:
-                nm = players_map[pid].get("name") or ""
-            pos = it.get("pos") or it.get("position") or ""
-            if not pos and pid and pid in players_map:
-                pos = players_map[pid].get("position") or ""
-            team = it.get("team") or it.get("nflteam") or ""
-            if not team and pid and pid in players_map:
-                team = players_map[pid].get("team") or players_map[pid].get("nflteam") or ""
+            pid, nm, pos, team, pts = _starter_fields(it)
+            if pid and not (nm and pos and team):
+                pm = pm_get(pid)
+                if pm is not None:
+                    if not nm:
+                        nm = pm.get("name") or ""
+                    if not pos:
+                        pos = pm.get("position") or ""
+                    if not team:
+                        team = pm.get("team") or pm.get("nflteam") or ""
 
             nm = _to_name_first_last(nm)
             pos = str(pos).upper().strip()
             team = str(team).upper().strip()
-            pts = float(it.get("pts") or it.get("points") or 0.0)
+            pts = float(pts)
 
             # find salary
             key = _norm_key(nm, pos, team)
             sal = sal_idx.get(key)
             if sal is None:
-                sal = _fuzzy_lookup(key, sal_idx, fuzzy_cache) or 0
+                sal = _fuzzy_lookup(key, sal_idx, fuzzy_cache, candidates=candidates) or 0
 
             ppk = (pts / (sal / 1000.0)) if sal else 0.0
 
@@ -146,22 +195,20 @@ def compute_values(
             )
 
     # Team efficiency
-    by_team: Dict[str, Dict[str, Any]] = {}
+    team_pts: Dict[str, float] = defaultdict(float)
+    team_sal: Dict[str, int] = defaultdict(int)
     for row in starters_out:
-        rec = by_team.setdefault(
-            row.franchise_id, {"franchise_id": row.franchise_id, "total_pts": 0.0, "total_sal": 0}
-        )
-        rec["total_pts"] += row.pts
-        rec["total_sal"] += row.salary
+        team_pts[row.franchise_id] += row.pts
+        team_sal[row.franchise_id] += row.salary
     team_eff: List[Dict[str, Any]] = []
-    for fid, rec in by_team.items():
-        sal = rec["total_sal"]
-        ppk = (rec["total_pts"] / (sal / 1000.0)) if sal else 0.0
+    for fid, total_pts in team_pts.items():
+        sal = team_sal[fid]
+        ppk = (total_pts / (sal / 1000.0)) if sal else 0.0
         team_eff.append(
             {
                 "franchise_id": fid,
                 "name": franchise_names.get(fid, fid),
-                "total_pts": rec["total_pts"],
+                "total_pts": total_pts,
                 "total_sal": int(sal),
                 "ppk": ppk,
             }
@@ -173,15 +220,11 @@ def compute_values(
     paid = [s for s in starters_out if s.salary > 0]
 
     # Top values: high return; bias to mid/low salaries so we don’t only list elite studs
-    top_values = sorted(
-        paid, key=lambda s: (s.ppk, s.pts), reverse=True
-    )[:15]
+    top_values = heapq.nlargest(15, paid, key=lambda s: (s.ppk, s.pts))
 
     # Top busts: price tags with disappointing pts/return
     bust_pool = [s for s in paid if s.salary >= 6000]  # only call it a bust if you actually paid up
-    top_busts = sorted(
-        bust_pool, key=lambda s: (s.ppk, s.pts)
-    )[:15]  # low ppk rises to top (worst first)
+    top_busts = heapq.nsmallest(15, bust_pool, key=lambda s: (s.ppk, s.pts))  # low ppk rises to top (worst first)
 
     def _serialize(rows: List[StarterRow]) -> List[Dict[str, Any]]:
         out: List[Dict[str, Any]] = []
@@ -0,0 +1,83 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src import post_outputs, roastbook
+from src.main import Starter, _build_standings_rows, _derive_vp_drama, _starters_payload, _walk_weekly_results
+from src.prose import Tone
+from src.util import StandingsRow, env_flag, norm_fid
+
+
+def _week_data():
+    return {
+        "weekly_results": {
+            "weeklyResults": {
+                "franchise": [
+                    {
+                        "id": "1",
+                        "score": "101.5",
+                        "starters": "11, 12",
+                        "player": [
+                            {"id": "11", "score": "20.5", "name": "Doe, John", "position": "QB", "team": "NE"},
+                            {"id": "12", "score": "8", "name": "Roe, Rich", "position": "WR"},
+                        ],
+                    },
+                    {"id": "0002", "score": "88"},
+                ]
+            }
+        },
+        "players_map": {"12": {"team": "KC"}},
+    }
+
+
+def test_walk_weekly_results_single_pass():
+    scores, starters = _walk_weekly_results(_week_data())
+    assert scores == [("0001", 101.5), ("0002", 88.0)]
+    assert [s.player_id for s in starters["0001"]] == ["11", "12"]
+    assert starters["0001"][1].team == "KC"
+    assert starters["0002"][0].player == "Team Total"
+    assert starters["0002"][0].pts == 88.0
+
+
+def test_standings_fallback_uses_walked_scores():
+    wd = _week_data()
+    scores, _ = _walk_weekly_results(wd)
+    rows = _build_standings_rows(wd, {"0001": "Alpha"}, scores)
+    assert [r.name for r in rows] == ["Alpha", "Team 0002"]
+    assert rows == _build_standings_rows(wd, {"0001": "Alpha"})
+
+
+def test_vp_drama_feeds_blurbs():
+    rows = [StandingsRow(id=f"{i:04d}", name=f"T{i}", pf=200.0 - i, vp=2.5 if i <= 5 else 0.0) for i in range(1, 8)]
+    vp = _derive_vp_drama(rows)
+    assert vp["villain"] == "T5" and vp["bubble"] == "T6"
+    for mod in (roastbook, post_outputs):
+        text = mod.vp_drama_blurb(vp, Tone("mild"))
+        assert "T1, T2, T3, T4, T5" in text
+        assert "**T6**" in text
+
+
+def test_starters_payload_feeds_chalk_blurb():
+    starters = {
+        "0001": [Starter(player_id="11", player="John Doe", pos="QB", team="NE", pts=20.5)],
+        "0002": [Starter(player_id="", player="Team Total", pos="", team=None, pts=88.0)],
+    }
+    payload = _starters_payload(starters)
+    assert payload["0001"][0] == {"player_id": "11", "player": "John Doe", "pos": "QB", "team": "NE", "pts": 20.5}
+    for mod in (roastbook, post_outputs):
+        assert mod.chalk_leverage_blurb(payload, Tone("mild"))
+
+
+def test_norm_fid_is_the_shared_padder():
+    assert [norm_fid(x) for x in (1, "1", " 12 ", None, "", "0001")] == ["0001", "0001", "0012", "0000", "0000", "0001"]
+
+
+def test_env_flag_parses_explicitly(monkeypatch):
+    for raw, expected in (("1", True), ("TRUE", True), (" yes ", True), ("0", False), ("false", False), ("", False)):
+        monkeypatch.setenv("NPFFL_DEBUG", raw)
+        assert env_flag("NPFFL_DEBUG") is expected
+    monkeypatch.delenv("NPFFL_DEBUG")
+    assert env_flag("NPFFL_DEBUG") is False
@@ -1,12 +1,16 @@
+import os
 import pathlib
+import shutil
 import sys
 import pandas as pd
+import pytest
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
-from src.load_salary import _detect_columns, _parse_week_number, _pick_week_file
+import src.load_salary as load_salary
+from src.load_salary import _detect_columns, _parse_week_number, _pick_week_file, load_salary_file
 
 def test_detect_columns_variant():
     df = pd.DataFrame({
@@ -44,3 +48,24 @@ def test_pick_week_file_selection(tmp_path):
 
     future = _pick_week_file(pattern, week=8)
     assert future and future.name == '2025_05_Salary.xlsx'
+
+
+def test_load_salary_file_uses_mtime_keyed_cache(tmp_path, monkeypatch):
+    sheet = tmp_path / '2025_01_Salary.xlsx'
+    shutil.copy(ROOT / 'data' / 'salaries' / '2025_01_Salary.xlsx', sheet)
+
+    first = load_salary_file(str(sheet), week=1)
+
+    # repeat loads in-process are served from memory as independent copies
+    cached = load_salary_file(str(sheet), week=1)
+    pd.testing.assert_frame_equal(first, cached)
+    cached.loc[:, 'salary'] = 0
+    again = load_salary_file(str(sheet), week=1)
+    pd.testing.assert_frame_equal(first, again)
+
+    # a touched sheet invalidates the cached frame
+    st = sheet.stat()
+    os.utime(sheet, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    monkeypatch.setattr(load_salary, '_read_excel_with_fallback', lambda p: pd.DataFrame())
+    with pytest.raises(ValueError):
+        load_salary_file(str(sheet), week=1)